@@ -6,6 +6,7 @@ running NotebookLM automation, and generating digests.
 """
 
 import sys
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
@@ -13,7 +14,7 @@ import click
 
 from . import __version__
 from .config import Status, ensure_directories
-from .db import count_papers, get_paper, init_db, list_papers
+from .db import close_connection, count_papers, get_paper, init_db, iter_papers
 from .utils import get_current_week_id, get_logger, setup_logging
 
 
@@ -44,6 +45,8 @@ def main(ctx: click.Context, debug: bool) -> None:
     # Initialize database and directories
     ensure_directories()
     init_db()
+    # Close the shared DB connection once the command finishes
+    ctx.call_on_close(close_connection)
 
 
 # =============================================================================
@@ -799,10 +802,11 @@ def status(
     
     week_id = week or get_current_week_id()
     
-    # Get papers
-    papers = list_papers(week_id=week_id, status=filter_status, limit=limit)
+    # Stream papers; the table is printed while rows are read
+    papers = iter_papers(week_id=week_id, status=filter_status, limit=limit)
+    first_paper = next(papers, None)
     
-    if not papers:
+    if first_paper is None:
         click.echo(f"No papers found for week {week_id}")
         if filter_status:
             click.echo(f"   (filtered by status: {filter_status})")
@@ -818,7 +822,7 @@ def status(
     click.echo(f"{'Paper ID':<15} {'Status':<10} {'Title':<50}")
     click.echo("-" * 75)
     
-    for paper in papers:
+    for paper in chain((first_paper,), papers):
         title = (paper.title or "Untitled")[:47]
         if len(paper.title or "") > 47:
             title += "..."
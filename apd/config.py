@@ -20,6 +20,7 @@ VIDEO_DIR = DATA_DIR / "videos"
 SLIDES_DIR = DATA_DIR / "slides"
 DIGEST_DIR = DATA_DIR / "digests"
 PROFILE_DIR = DATA_DIR / "profiles"
+CACHE_DIR = DATA_DIR / "cache"
 
 # Database
 DB_PATH = DATA_DIR / "apd.db"
@@ -62,6 +63,12 @@ DOWNLOAD_CHUNK_SIZE = 8192
 # Delay between downloads (seconds) to respect arXiv rate limits
 DOWNLOAD_DELAY_SECONDS = 3
 
+# How long cached paper detail pages stay fresh (seconds)
+PAPER_DETAILS_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# Concurrent video uploads to Hugging Face when publishing a week
+UPLOAD_MAX_WORKERS = 4
+
 # Playwright timeouts (milliseconds)
 PLAYWRIGHT_TIMEOUT = 60000  # 60 seconds for general operations
 PLAYWRIGHT_NAVIGATION_TIMEOUT = 120000  # 120 seconds for page navigation
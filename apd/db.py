@@ -6,26 +6,39 @@ Provides SQLite-based paper tracking with status management.
 
 import re
 import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, fields, replace
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Iterable, Iterator, Optional
 
 from .config import DB_PATH, Status
-from .utils import get_logger, now_iso
+from .utils import get_logger
 
 logger = get_logger()
 
+# Week format: 2026-03 (4 digits, dash, 2 digits)
+_WEEK_RE = re.compile(r'^\d{4}-\d{2}$')
+
+# week_id clauses produced by _build_week_id_clause: a week matches its own ID
+# plus its 7 daily dates. An IN list (rather than an OR'd date range) can be
+# combined with a status equality into one (status, week_id) index seek.
+_WEEK_CLAUSE = f"week_id IN ({','.join('?' * 8)})"
+_DATE_CLAUSE = "week_id = ?"
+
 
 def _is_week_format(period_id: str) -> bool:
     """Check if period_id is week format (YYYY-WW) vs date format (YYYY-MM-DD)."""
-    # Week format: 2026-03 (4 digits, dash, 2 digits)
     # Date format: 2026-01-15 (4 digits, dash, 2 digits, dash, 2 digits)
-    return bool(re.match(r'^\d{4}-\d{2}$', period_id))
+    return bool(_WEEK_RE.match(period_id))
 
 
-def _get_dates_for_week(week_id: str) -> list[str]:
+@lru_cache(maxsize=512)
+def _get_dates_for_week(week_id: str) -> tuple[str, ...]:
     """
     Get all dates (YYYY-MM-DD) for a given week.
     
@@ -33,11 +46,11 @@ def _get_dates_for_week(week_id: str) -> list[str]:
         week_id: Week identifier (e.g., "2026-03")
         
     Returns:
-        List of date strings for that week (Monday to Sunday)
+        Tuple of date strings for that week (Monday to Sunday)
     """
     parts = week_id.split("-")
     if len(parts) != 2:
-        return []
+        return ()
     
     year, week = int(parts[0]), int(parts[1])
     
@@ -47,15 +60,14 @@ def _get_dates_for_week(week_id: str) -> list[str]:
     monday = start_of_week1 + timedelta(weeks=week - 1)
     
     # Generate all 7 days of the week
-    dates = []
-    for i in range(7):
-        day = monday + timedelta(days=i)
-        dates.append(day.strftime("%Y-%m-%d"))
-    
-    return dates
+    return tuple(
+        (monday + timedelta(days=i)).strftime("%Y-%m-%d")
+        for i in range(7)
+    )
 
 
-def _build_week_id_clause(week_id: str) -> tuple[str, list]:
+@lru_cache(maxsize=512)
+def _build_week_id_clause(week_id: str) -> tuple[str, tuple[str, ...]]:
     """
     Build SQL clause for week_id matching.
     
@@ -66,24 +78,22 @@ def _build_week_id_clause(week_id: str) -> tuple[str, list]:
         week_id: Week or date identifier
         
     Returns:
-        Tuple of (SQL clause, parameters list)
+        Tuple of (SQL clause, parameters tuple)
     """
     if _is_week_format(week_id):
         # Match both week format and all daily dates in that week
         dates = _get_dates_for_week(week_id)
-        all_ids = [week_id] + dates
-        placeholders = ",".join("?" * len(all_ids))
-        return f"week_id IN ({placeholders})", all_ids
+        return _WEEK_CLAUSE, (week_id, *dates)
     else:
         # Just match the exact value
-        return "week_id = ?", [week_id]
+        return _DATE_CLAUSE, (week_id,)
 
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Paper:
     """Represents a paper record in the database."""
     paper_id: str
@@ -103,34 +113,223 @@ class Paper:
     updated_at: Optional[str] = None
 
 
+# =============================================================================
+# SQL Statements
+# =============================================================================
+
+# Fixed statement text so sqlite3's per-connection statement cache hits reliably
+
+# Same format as utils.now_iso(), computed by SQLite at write time
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%S', 'now', 'localtime')"
+
+# Explicit column list in Paper field order, so rows map positionally onto Paper
+_PAPER_COLUMNS = ", ".join(f.name for f in fields(Paper))
+
+_SQL_GET_PAPER = f"SELECT {_PAPER_COLUMNS} FROM papers WHERE paper_id = ?"
+
+# Fixed-shape upsert: None leaves the stored value untouched, week_id is
+# only set on insert
+_SQL_UPSERT_PAPER_MANY = f"""
+    INSERT INTO papers (
+        paper_id, week_id, title, hf_url, pdf_url, pdf_path,
+        pdf_sha256, notebooklm_note_name, video_path, slides_path, summary, status,
+        retry_count, last_error, updated_at
+    ) VALUES (
+        :paper_id, :week_id, :title, :hf_url, :pdf_url, :pdf_path,
+        :pdf_sha256, :notebooklm_note_name, :video_path, :slides_path, :summary,
+        COALESCE(:status, 'NEW'), 0, :last_error, {_SQL_NOW}
+    )
+    ON CONFLICT(paper_id) DO UPDATE SET
+        title = COALESCE(:title, title),
+        hf_url = COALESCE(:hf_url, hf_url),
+        pdf_url = COALESCE(:pdf_url, pdf_url),
+        pdf_path = COALESCE(:pdf_path, pdf_path),
+        pdf_sha256 = COALESCE(:pdf_sha256, pdf_sha256),
+        notebooklm_note_name = COALESCE(:notebooklm_note_name, notebooklm_note_name),
+        video_path = COALESCE(:video_path, video_path),
+        slides_path = COALESCE(:slides_path, slides_path),
+        summary = COALESCE(:summary, summary),
+        status = COALESCE(:status, status),
+        last_error = COALESCE(:last_error, last_error),
+        updated_at = {_SQL_NOW}
+"""
+
+# executemany() cannot return rows, so only the single-row variant uses RETURNING
+_SQL_UPSERT_PAPER = _SQL_UPSERT_PAPER_MANY + f"    RETURNING {_PAPER_COLUMNS}\n"
+
+# Optional fields accepted by upsert_paper / upsert_papers_many
+_UPSERT_FIELDS = (
+    "title", "hf_url", "pdf_url", "pdf_path", "pdf_sha256",
+    "notebooklm_note_name", "video_path", "slides_path", "summary",
+    "status", "last_error",
+)
+
+_SQL_UPDATE_STATUS = f"""
+    UPDATE papers
+    SET status = ?, last_error = ?, updated_at = {_SQL_NOW}
+    WHERE paper_id = ?
+    RETURNING {_PAPER_COLUMNS}
+"""
+
+_SQL_UPDATE_STATUS_RETRY = f"""
+    UPDATE papers
+    SET status = ?, last_error = ?, retry_count = retry_count + 1, updated_at = {_SQL_NOW}
+    WHERE paper_id = ?
+    RETURNING {_PAPER_COLUMNS}
+"""
+
+
+# Bound parameters per IN (...) query, below SQLite's historical limit of 999
+_MAX_SQL_PARAMS = 900
+
+# Status precedence for the processing pipeline
+_STATUS_ORDER = (Status.NEW, Status.PDF_OK, Status.NBLM_OK, Status.VIDEO_OK)
+
+# Every status value, for zero-filled per-status counts
+_ALL_STATUSES = (*_STATUS_ORDER, Status.ERROR)
+
+# Statuses a paper may be in to still need work for each target status
+_PROCESSING_STATUSES = {
+    target: _STATUS_ORDER[:idx]
+    for idx, target in enumerate(_STATUS_ORDER)
+    if idx > 0
+}
+
+# Fully expanded processing queries keyed by (target_status, week_id clause);
+# LIMIT -1 means no limit in SQLite
+_PROCESSING_SQL = {
+    (target, week_clause): f"""
+        SELECT {_PAPER_COLUMNS} FROM papers
+        WHERE {week_clause}
+        AND status IN ({",".join("?" * len(needed))})
+        AND retry_count < ?
+        ORDER BY paper_id
+        LIMIT ?
+    """
+    for target, needed in _PROCESSING_STATUSES.items()
+    for week_clause in (_WEEK_CLAUSE, _DATE_CLAUSE)
+}
+
+
 # =============================================================================
 # Database Management
 # =============================================================================
 
+# Schema version stored in PRAGMA user_version; bump when adding migrations
+_SCHEMA_VERSION = 3
+
+# Shared connection, opened lazily and reused for the lifetime of the process
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.RLock()
+
+# Small LRU in front of get_paper(): paper_id -> (expires_at, Paper). Writes
+# through this module drop the affected entries; the TTL bounds staleness
+# from other processes sharing the database file.
+_PAPER_CACHE_SIZE = 256
+_PAPER_CACHE_TTL_SECONDS = 30.0
+_paper_cache: OrderedDict[str, tuple[float, Paper]] = OrderedDict()
+
+# Distinct week_ids, newest first; dropped by writes through this module
+# that can add a week
+_week_ids_cache: Optional[list[str]] = None
+
+# Applied once when the shared connection is opened
+_CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA mmap_size=268435456",
+)
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open and configure the shared SQLite connection."""
+    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
+    # Autocommit mode: single statements commit on their own, multi-statement
+    # writes open an explicit transaction via _write_transaction()
+    conn = sqlite3.connect(DB_PATH, isolation_level=None, check_same_thread=False)
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
 @contextmanager
 def get_connection() -> Iterator[sqlite3.Connection]:
     """
     Context manager for database connections.
     
+    Yields the shared, long-lived connection; commits any open
+    transaction on success and rolls it back on error. Access is
+    serialized across threads.
+    
     Yields:
-        SQLite connection with row factory enabled
+        SQLite connection
     """
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
-    try:
+    global _conn
+    
+    with _conn_lock:
+        if _conn is None:
+            _conn = _open_connection()
+        conn = _conn
+        try:
+            yield conn
+            # Only explicit write transactions need committing
+            if conn.in_transaction:
+                conn.commit()
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+
+
+@contextmanager
+def _write_transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Context manager for a multi-statement write transaction.
+    
+    Takes the write lock up front with BEGIN IMMEDIATE; the transaction is
+    committed on success and rolled back on error by get_connection().
+    
+    Yields:
+        SQLite connection inside an open transaction
+    """
+    with get_connection() as conn:
+        conn.execute("BEGIN IMMEDIATE")
         yield conn
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
-    finally:
-        conn.close()
+
+
+def _invalidate_papers(paper_ids: Iterable[str]) -> None:
+    """Drop cached get_paper() results for the given paper IDs."""
+    with _conn_lock:
+        for paper_id in paper_ids:
+            _paper_cache.pop(paper_id, None)
+
+
+def _invalidate_week_ids() -> None:
+    """Drop the cached list_week_ids() result."""
+    global _week_ids_cache
+    
+    with _conn_lock:
+        _week_ids_cache = None
+
+
+def close_connection() -> None:
+    """Close the shared connection (it is reopened on next use)."""
+    global _conn, _week_ids_cache
+    
+    with _conn_lock:
+        _paper_cache.clear()
+        _week_ids_cache = None
+        if _conn is not None:
+            _conn.close()
+            _conn = None
 
 
 def init_db() -> None:
     """Initialize the database schema."""
-    with get_connection() as conn:
+    with _write_transaction() as conn:
         cursor = conn.cursor()
         
         # Create papers table
@@ -154,32 +353,50 @@ def init_db() -> None:
             )
         """)
         
-        # Add slides_path column if it doesn't exist (migration for existing databases)
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN slides_path TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
+        # One-time migrations for databases created by older schema versions
+        cursor.execute("PRAGMA user_version")
+        (user_version,) = cursor.fetchone()
+        if user_version < _SCHEMA_VERSION:
+            cursor.execute("PRAGMA table_info(papers)")
+            existing_columns = {row[1] for row in cursor.fetchall()}
+            for column in ("slides_path", "summary"):
+                if column not in existing_columns:
+                    cursor.execute(f"ALTER TABLE papers ADD COLUMN {column} TEXT")
+            # Prefixes of idx_papers_ready / idx_papers_status_week, so redundant
+            cursor.execute("DROP INDEX IF EXISTS idx_papers_week_status")
+            cursor.execute("DROP INDEX IF EXISTS idx_papers_status")
+            cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
         
-        # Add summary column if it doesn't exist (migration for existing databases)
-        try:
-            cursor.execute("ALTER TABLE papers ADD COLUMN summary TEXT")
-        except sqlite3.OperationalError:
-            pass  # Column already exists
-        
-        # Create indexes for common queries
+        # Create indexes for common queries. idx_papers_week is also a prefix
+        # of idx_papers_ready but is kept: as the smallest index on week_id it
+        # is the covering index for DISTINCT week_id and week-only counts
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_papers_week 
             ON papers(week_id)
         """)
+        # Processing queue: max_retries is a bound parameter, so a partial
+        # index on a fixed retry limit could not be used; index the full key
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_papers_status 
-            ON papers(status)
+            CREATE INDEX IF NOT EXISTS idx_papers_ready 
+            ON papers(week_id, status, retry_count, paper_id)
         """)
+        # Covering index for status-first filters (counts by status)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_papers_week_status 
-            ON papers(week_id, status)
+            CREATE INDEX IF NOT EXISTS idx_papers_status_week 
+            ON papers(status, week_id)
         """)
         
+        # Planner statistics: gather them while papers has none (cheap while
+        # the table is small, and a no-op while it is empty); after that,
+        # PRAGMA optimize re-analyzes only when SQLite judges them stale
+        # (sqlite_stat1 itself only exists once ANALYZE has run)
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        has_stats = cursor.fetchone() is not None
+        if has_stats:
+            cursor.execute("SELECT 1 FROM sqlite_stat1 WHERE tbl = 'papers' LIMIT 1")
+            has_stats = cursor.fetchone() is not None
+        cursor.execute("PRAGMA optimize" if has_stats else "ANALYZE papers")
+        
         logger.debug("Database initialized")
 
 
@@ -198,15 +415,50 @@ def get_paper(paper_id: str) -> Optional[Paper]:
         Paper object or None if not found
     """
     with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM papers WHERE paper_id = ?", (paper_id,))
-        row = cursor.fetchone()
+        cached = _paper_cache.get(paper_id)
+        if cached is not None:
+            if cached[0] > time.monotonic():
+                _paper_cache.move_to_end(paper_id)
+                # A copy, so callers can't change the cached instance
+                return replace(cached[1])
+            del _paper_cache[paper_id]
+        
+        row = conn.execute(_SQL_GET_PAPER, (paper_id,)).fetchone()
         
         if row:
-            return Paper(**dict(row))
+            paper = Paper(*row)
+            _paper_cache[paper_id] = (time.monotonic() + _PAPER_CACHE_TTL_SECONDS, paper)
+            if len(_paper_cache) > _PAPER_CACHE_SIZE:
+                _paper_cache.popitem(last=False)
+            return replace(paper)
         return None
 
 
+def get_paper_week_ids(paper_ids: Iterable[str]) -> dict[str, str]:
+    """
+    Look up which of the given papers exist, in as few queries as possible.
+    
+    Args:
+        paper_ids: Paper IDs to check
+        
+    Returns:
+        Dict mapping each stored paper_id to its week_id; missing IDs are absent
+    """
+    ids = list(paper_ids)
+    week_ids: dict[str, str] = {}
+    
+    with get_connection() as conn:
+        for start in range(0, len(ids), _MAX_SQL_PARAMS):
+            chunk = ids[start:start + _MAX_SQL_PARAMS]
+            placeholders = ",".join("?" * len(chunk))
+            week_ids.update(conn.execute(
+                f"SELECT paper_id, week_id FROM papers WHERE paper_id IN ({placeholders})",
+                chunk,
+            ))
+    
+    return week_ids
+
+
 def upsert_paper(
     paper_id: str,
     week_id: str,
@@ -235,77 +487,62 @@ def upsert_paper(
     Returns:
         The updated Paper object
     """
-    existing = get_paper(paper_id)
-    now = now_iso()
-    
     with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        if existing:
-            # Build UPDATE query dynamically for non-None fields
-            updates = []
-            values = []
-            
-            if title is not None:
-                updates.append("title = ?")
-                values.append(title)
-            if hf_url is not None:
-                updates.append("hf_url = ?")
-                values.append(hf_url)
-            if pdf_url is not None:
-                updates.append("pdf_url = ?")
-                values.append(pdf_url)
-            if pdf_path is not None:
-                updates.append("pdf_path = ?")
-                values.append(pdf_path)
-            if pdf_sha256 is not None:
-                updates.append("pdf_sha256 = ?")
-                values.append(pdf_sha256)
-            if notebooklm_note_name is not None:
-                updates.append("notebooklm_note_name = ?")
-                values.append(notebooklm_note_name)
-            if video_path is not None:
-                updates.append("video_path = ?")
-                values.append(video_path)
-            if slides_path is not None:
-                updates.append("slides_path = ?")
-                values.append(slides_path)
-            if summary is not None:
-                updates.append("summary = ?")
-                values.append(summary)
-            if status is not None:
-                updates.append("status = ?")
-                values.append(status)
-            if last_error is not None:
-                updates.append("last_error = ?")
-                values.append(last_error)
-            
-            updates.append("updated_at = ?")
-            values.append(now)
-            values.append(paper_id)
-            
-            if updates:
-                query = f"UPDATE papers SET {', '.join(updates)} WHERE paper_id = ?"
-                cursor.execute(query, values)
-                
-            logger.debug(f"Updated paper: {paper_id}")
-        else:
-            # INSERT new record
-            cursor.execute("""
-                INSERT INTO papers (
-                    paper_id, week_id, title, hf_url, pdf_url, pdf_path,
-                    pdf_sha256, notebooklm_note_name, video_path, slides_path, summary, status,
-                    retry_count, last_error, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                paper_id, week_id, title, hf_url, pdf_url, pdf_path,
-                pdf_sha256, notebooklm_note_name, video_path, slides_path, summary,
-                status or Status.NEW, 0, last_error, now
-            ))
-            logger.debug(f"Inserted paper: {paper_id}")
+        row = conn.execute(_SQL_UPSERT_PAPER, {
+            "paper_id": paper_id,
+            "week_id": week_id,
+            "title": title,
+            "hf_url": hf_url,
+            "pdf_url": pdf_url,
+            "pdf_path": pdf_path,
+            "pdf_sha256": pdf_sha256,
+            "notebooklm_note_name": notebooklm_note_name,
+            "video_path": video_path,
+            "slides_path": slides_path,
+            "summary": summary,
+            "status": status,
+            "last_error": last_error,
+        }).fetchone()
+        _invalidate_papers((paper_id,))
+        _invalidate_week_ids()
+        logger.debug(f"Upserted paper: {paper_id}")
     
-    return get_paper(paper_id)  # type: ignore
+    return Paper(*row)
+
 
+def upsert_papers_many(papers: list[dict]) -> int:
+    """
+    Insert or update many paper records in a single transaction.
+    
+    Each dict must contain ``paper_id`` and ``week_id``; other keys follow
+    the same semantics as upsert_paper (missing or None leaves the stored
+    value untouched).
+    
+    Args:
+        papers: List of paper field dicts
+        
+    Returns:
+        Number of records written
+    """
+    if not papers:
+        return 0
+    
+    rows = [
+        {
+            "paper_id": paper["paper_id"],
+            "week_id": paper["week_id"],
+            **{field: paper.get(field) for field in _UPSERT_FIELDS},
+        }
+        for paper in papers
+    ]
+    
+    with _write_transaction() as conn:
+        conn.executemany(_SQL_UPSERT_PAPER_MANY, rows)
+        _invalidate_papers(row["paper_id"] for row in rows)
+        _invalidate_week_ids()
+        logger.debug(f"Upserted {len(rows)} papers")
+    
+    return len(rows)
 
 
 def update_status(
@@ -327,29 +564,77 @@ def update_status(
         Updated Paper object or None if not found
     """
     with get_connection() as conn:
-        cursor = conn.cursor()
-        now = now_iso()
+        query = _SQL_UPDATE_STATUS_RETRY if increment_retry else _SQL_UPDATE_STATUS
+        row = conn.execute(query, (status, error, paper_id)).fetchone()
+        _invalidate_papers((paper_id,))
         
-        if increment_retry:
-            cursor.execute("""
-                UPDATE papers 
-                SET status = ?, last_error = ?, retry_count = retry_count + 1, updated_at = ?
-                WHERE paper_id = ?
-            """, (status, error, now, paper_id))
-        else:
-            cursor.execute("""
-                UPDATE papers 
-                SET status = ?, last_error = ?, updated_at = ?
-                WHERE paper_id = ?
-            """, (status, error, now, paper_id))
-        
-        if cursor.rowcount == 0:
+        if row is None:
             logger.warning(f"Paper not found for status update: {paper_id}")
             return None
             
         logger.debug(f"Updated status for {paper_id}: {status}")
     
-    return get_paper(paper_id)
+    return Paper(*row)
+
+
+def _build_papers_query(
+    week_id: Optional[str],
+    status: Optional[str],
+    limit: Optional[int]
+) -> tuple[str, list]:
+    """Build the filtered paper query shared by iter_papers and list_papers."""
+    query = f"SELECT {_PAPER_COLUMNS} FROM papers WHERE 1=1"
+    params: list = []
+    
+    if week_id:
+        clause, clause_params = _build_week_id_clause(week_id)
+        query += f" AND {clause}"
+        params.extend(clause_params)
+    if status:
+        query += " AND status = ?"
+        params.append(status)
+        
+    query += " ORDER BY updated_at DESC"
+    
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+    
+    return query, params
+
+
+def iter_papers(
+    week_id: Optional[str] = None,
+    status: Optional[str] = None,
+    limit: Optional[int] = None
+) -> Iterator[Paper]:
+    """
+    Stream papers with optional filtering.
+    
+    Rows are read from the cursor as the caller iterates, so the result
+    set is never materialized as a whole. The cursor is stepped outside the
+    connection lock, so this is for single-threaded use only; threaded code
+    should call list_papers(). Avoid writing to the database while
+    iterating: updates made inside the loop can change the rows still being
+    read, so a paper may be skipped or seen twice. Use list_papers() for
+    loops that update papers.
+    
+    Args:
+        week_id: Filter by week
+        status: Filter by status
+        limit: Maximum number of results
+        
+    Yields:
+        Paper objects
+    """
+    query, params = _build_papers_query(week_id, status, limit)
+    
+    # Only the execute holds the lock; iteration happens on the caller's pace
+    with get_connection() as conn:
+        cursor = conn.execute(query, params)
+    
+    for row in cursor:
+        yield Paper(*row)
 
 
 def list_papers(
@@ -368,30 +653,47 @@ def list_papers(
     Returns:
         List of Paper objects
     """
+    query, params = _build_papers_query(week_id, status, limit)
+    
     with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        query = "SELECT * FROM papers WHERE 1=1"
-        params: list = []
-        
-        if week_id:
-            clause, clause_params = _build_week_id_clause(week_id)
-            query += f" AND {clause}"
-            params.extend(clause_params)
-        if status:
-            query += " AND status = ?"
-            params.append(status)
-            
-        query += " ORDER BY updated_at DESC"
-        
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        rows = conn.execute(query, params).fetchall()
+    
+    return [Paper(*row) for row in rows]
+
+
+def fetch_week_bundle(week_id: str) -> tuple[list[Paper], Counter[str]]:
+    """
+    Get all papers for a week together with their per-status counts.
+    
+    Reads the week once instead of listing and counting separately.
+    
+    Args:
+        week_id: Week or date identifier
         
-        return [Paper(**dict(row)) for row in rows]
+    Returns:
+        Tuple of (papers ordered by updated_at DESC, Counter of statuses)
+    """
+    papers = list_papers(week_id=week_id)
+    return papers, Counter(paper.status for paper in papers)
+
+
+def list_week_ids() -> list[str]:
+    """
+    List all week_ids that have papers, newest first.
+    
+    The result is cached until a paper is next upserted through this module.
+    
+    Returns:
+        List of week_id strings, sorted descending
+    """
+    global _week_ids_cache
+    
+    with get_connection() as conn:
+        if _week_ids_cache is None:
+            # Served from idx_papers_week as a covering index, no sort step
+            rows = conn.execute("SELECT DISTINCT week_id FROM papers ORDER BY week_id DESC")
+            _week_ids_cache = [week_id for (week_id,) in rows]
+        return list(_week_ids_cache)
 
 
 def count_papers(week_id: Optional[str] = None, status: Optional[str] = None) -> int:
@@ -406,8 +708,6 @@ def count_papers(week_id: Optional[str] = None, status: Optional[str] = None) ->
         Count of matching papers
     """
     with get_connection() as conn:
-        cursor = conn.cursor()
-        
         query = "SELECT COUNT(*) FROM papers WHERE 1=1"
         params: list = []
         
@@ -419,8 +719,34 @@ def count_papers(week_id: Optional[str] = None, status: Optional[str] = None) ->
             query += " AND status = ?"
             params.append(status)
         
-        cursor.execute(query, params)
-        return cursor.fetchone()[0]
+        (count,) = conn.execute(query, params).fetchone()
+        return count
+
+
+def count_papers_by_status(week_id: Optional[str] = None) -> dict[str, int]:
+    """
+    Count papers per status in a single query.
+    
+    Args:
+        week_id: Filter by week
+        
+    Returns:
+        Dict mapping every known status (and any other stored status) to its
+        count, with 0 for statuses that have no papers
+    """
+    with get_connection() as conn:
+        query = "SELECT status, COUNT(*) FROM papers WHERE 1=1"
+        params: tuple = ()
+        
+        if week_id:
+            clause, params = _build_week_id_clause(week_id)
+            query += f" AND {clause}"
+        
+        query += " GROUP BY status"
+        
+        counts = dict.fromkeys(_ALL_STATUSES, 0)
+        counts.update(conn.execute(query, params))
+        return counts
 
 
 def get_papers_for_processing(
@@ -441,37 +767,16 @@ def get_papers_for_processing(
     Returns:
         List of papers that need processing
     """
-    # Define status precedence
-    status_order = [Status.NEW, Status.PDF_OK, Status.NBLM_OK, Status.VIDEO_OK]
-    
-    if target_status not in status_order:
+    needed_statuses = _PROCESSING_STATUSES.get(target_status)
+    if needed_statuses is None:
         return []
     
-    target_idx = status_order.index(target_status)
-    needed_statuses = status_order[:target_idx]
+    # Build week_id clause for smart matching
+    week_clause, week_params = _build_week_id_clause(week_id)
+    query = _PROCESSING_SQL[(target_status, week_clause)]
+    params = (*week_params, *needed_statuses, max_retries, limit or -1)
     
     with get_connection() as conn:
-        cursor = conn.cursor()
-        
-        # Build week_id clause for smart matching
-        week_clause, week_params = _build_week_id_clause(week_id)
-        
-        status_placeholders = ",".join("?" * len(needed_statuses))
-        query = f"""
-            SELECT * FROM papers 
-            WHERE {week_clause}
-            AND status IN ({status_placeholders})
-            AND retry_count < ?
-            ORDER BY paper_id
-        """
-        
-        params = week_params + needed_statuses + [max_retries]
-        
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        rows = conn.execute(query, params).fetchall()
         
-        return [Paper(**dict(row)) for row in rows]
+        return [Paper(*row) for row in rows]
@@ -4,17 +4,26 @@ Digest generator module for Auto Paper Digest.
 Generates weekly digest files in Markdown and JSON formats.
 """
 
-import json
+import io
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Mapping, Optional
 
 from .config import DIGEST_DIR, Status
-from .db import count_papers, list_papers
-from .utils import ensure_dir, get_logger, parse_week_id
+from .db import Paper, count_papers_by_status, fetch_week_bundle, list_week_ids
+from .utils import dumps_json, ensure_dir, get_logger, parse_week_id
 
 logger = get_logger()
 
+# Per-paper block of the digest; the optional sections are prebuilt strings
+_PAPER_TEMPLATE = (
+    "### {i}. {title}\n\n"
+    "**Paper ID:** `{paper_id}`\n\n"
+    "{links_block}"
+    "{files_block}"
+    "**Status:** {status}\n\n---\n\n"
+)
+
 
 def generate_digest(week_id: str, include_all: bool = False) -> tuple[Path, Path]:
     """
@@ -29,11 +38,12 @@ def generate_digest(week_id: str, include_all: bool = False) -> tuple[Path, Path
     """
     logger.info(f"Generating digest for week {week_id}")
     
-    # Get papers for this week
+    # Get papers and status counts for this week in one read
+    week_papers, counts = fetch_week_bundle(week_id)
     if include_all:
-        papers = list_papers(week_id=week_id)
+        papers = week_papers
     else:
-        papers = list_papers(week_id=week_id, status=Status.VIDEO_OK)
+        papers = [p for p in week_papers if p.status == Status.VIDEO_OK]
     
     if not papers:
         logger.warning(f"No papers found for week {week_id}")
@@ -67,17 +77,10 @@ def generate_digest(week_id: str, include_all: bool = False) -> tuple[Path, Path
         "generated_at": datetime.now().isoformat(),
         "total_papers": len(papers),
         "papers": papers_data,
-        "stats": {
-            "total": count_papers(week_id=week_id),
-            "video_ok": count_papers(week_id=week_id, status=Status.VIDEO_OK),
-            "pdf_ok": count_papers(week_id=week_id, status=Status.PDF_OK),
-            "new": count_papers(week_id=week_id, status=Status.NEW),
-            "error": count_papers(week_id=week_id, status=Status.ERROR),
-        }
+        "stats": _stats_from_counts(counts),
     }
     
-    with open(json_path, "w", encoding="utf-8") as f:
-        json.dump(digest_json, f, indent=2, ensure_ascii=False)
+    json_path.write_bytes(dumps_json(digest_json))
     
     logger.info(f"Generated JSON digest: {json_path}")
     
@@ -112,72 +115,73 @@ def generate_markdown(
     Returns:
         Markdown content string
     """
-    lines = [
-        f"# Weekly AI Paper Digest - {week_id}",
-        "",
-        f"**Year:** {year} | **Week:** {week}",
-        f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        "",
-        "## Summary",
-        "",
-        f"- Total papers: {stats['total']}",
-        f"- Videos generated: {stats['video_ok']}",
-        f"- PDFs downloaded: {stats['pdf_ok']}",
-        f"- Pending: {stats['new']}",
-        f"- Errors: {stats['error']}",
-        "",
-        "---",
-        "",
-        "## Papers",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write(f"""# Weekly AI Paper Digest - {week_id}
+
+**Year:** {year} | **Week:** {week}
+**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M')}
+
+## Summary
+
+- Total papers: {stats['total']}
+- Videos generated: {stats['video_ok']}
+- PDFs downloaded: {stats['pdf_ok']}
+- Pending: {stats['new']}
+- Errors: {stats['error']}
+
+---
+
+## Papers
+
+""")
     
     if not papers:
-        lines.append("*No papers with completed videos for this week.*")
+        buf.write("*No papers with completed videos for this week.*\n")
     else:
         for i, paper in enumerate(papers, 1):
-            lines.append(f"### {i}. {paper.title or 'Untitled'}")
-            lines.append("")
-            lines.append(f"**Paper ID:** `{paper.paper_id}`")
-            lines.append("")
-            
-            # Links
-            links = []
-            if paper.hf_url:
-                links.append(f"[HuggingFace]({paper.hf_url})")
-            if paper.pdf_url:
-                links.append(f"[arXiv PDF]({paper.pdf_url})")
-            if links:
-                lines.append(f"**Links:** {' | '.join(links)}")
-                lines.append("")
-            
-            # Local files
-            files = []
-            if paper.pdf_path:
-                files.append(f"PDF: `{paper.pdf_path}`")
-            if paper.video_path:
-                files.append(f"Video: `{paper.video_path}`")
-            if files:
-                lines.append(f"**Local files:**")
-                for f in files:
-                    lines.append(f"- {f}")
-                lines.append("")
-            
-            lines.append(f"**Status:** {paper.status}")
-            lines.append("")
-            lines.append("---")
-            lines.append("")
+            buf.write(_PAPER_TEMPLATE.format_map({
+                "i": i,
+                "title": paper.title or "Untitled",
+                "paper_id": paper.paper_id,
+                "links_block": _links_block(paper),
+                "files_block": _files_block(paper),
+                "status": paper.status,
+            }))
     
     # Footer
-    lines.extend([
-        "",
-        "## About",
-        "",
-        "This digest was automatically generated by [Auto Paper Digest](https://github.com/brianxiadong/auto-paper-digest).",
-        "Videos are created using NotebookLM's Audio Overview feature.",
-    ])
-    
-    return "\n".join(lines)
+    buf.write(
+        "\n"
+        "## About\n"
+        "\n"
+        "This digest was automatically generated by [Auto Paper Digest](https://github.com/brianxiadong/auto-paper-digest).\n"
+        "Videos are created using NotebookLM's Audio Overview feature."
+    )
+    
+    return buf.getvalue()
+
+
+def _links_block(paper: Paper) -> str:
+    """Build the "Links" line for a paper, or "" if it has no links."""
+    links = []
+    if paper.hf_url:
+        links.append(f"[HuggingFace]({paper.hf_url})")
+    if paper.pdf_url:
+        links.append(f"[arXiv PDF]({paper.pdf_url})")
+    if not links:
+        return ""
+    return f"**Links:** {' | '.join(links)}\n\n"
+
+
+def _files_block(paper: Paper) -> str:
+    """Build the "Local files" list for a paper, or "" if it has none."""
+    files = []
+    if paper.pdf_path:
+        files.append(f"- PDF: `{paper.pdf_path}`\n")
+    if paper.video_path:
+        files.append(f"- Video: `{paper.video_path}`\n")
+    if not files:
+        return ""
+    return f"**Local files:**\n{''.join(files)}\n"
 
 
 def list_available_weeks() -> list[str]:
@@ -187,24 +191,36 @@ def list_available_weeks() -> list[str]:
     Returns:
         List of week_id strings, sorted descending
     """
-    from .db import get_connection
+    return list_week_ids()
+
+
+def get_digest_stats(week_id: str) -> dict:
+    """
+    Get the per-status paper counts shown in a digest.
     
-    with get_connection() as conn:
-        cursor = conn.cursor()
-        cursor.execute("SELECT DISTINCT week_id FROM papers ORDER BY week_id DESC")
-        rows = cursor.fetchall()
-        return [row[0] for row in rows]
+    Args:
+        week_id: Week identifier
+        
+    Returns:
+        Stats dict with total, video_ok, pdf_ok, new and error counts
+    """
+    return _stats_from_counts(count_papers_by_status(week_id=week_id))
+
+
+def _stats_from_counts(counts: Mapping[str, int]) -> dict:
+    """Build the digest stats dict from per-status counts."""
+    return {
+        "total": sum(counts.values()),
+        "video_ok": counts.get(Status.VIDEO_OK, 0),
+        "pdf_ok": counts.get(Status.PDF_OK, 0),
+        "new": counts.get(Status.NEW, 0),
+        "error": counts.get(Status.ERROR, 0),
+    }
 
 
 def print_digest_summary(week_id: str) -> None:
     """Print a summary of the digest to console."""
-    stats = {
-        "total": count_papers(week_id=week_id),
-        "video_ok": count_papers(week_id=week_id, status=Status.VIDEO_OK),
-        "pdf_ok": count_papers(week_id=week_id, status=Status.PDF_OK),
-        "new": count_papers(week_id=week_id, status=Status.NEW),
-        "error": count_papers(week_id=week_id, status=Status.ERROR),
-    }
+    stats = get_digest_stats(week_id)
     
     print(f"\n📊 Week {week_id} Summary:")
     print(f"   Total papers:     {stats['total']}")
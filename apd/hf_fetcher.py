@@ -4,29 +4,65 @@ Hugging Face papers fetcher module.
 Scrapes weekly papers from Hugging Face and stores them in the database.
 """
 
+import json
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .config import (
     ARXIV_PDF_URL,
+    CACHE_DIR,
     HF_PAPERS_DATE_PAGE_URL,
     HF_PAPERS_DATE_URL,
     HF_PAPERS_URL,
     HF_PAPERS_WEEK_URL,
+    PAPER_DETAILS_CACHE_TTL_SECONDS,
     REQUEST_TIMEOUT,
     USER_AGENT,
 )
-from .db import get_paper, upsert_paper
-from .utils import get_logger, parse_week_id
+from .db import get_paper_week_ids, upsert_papers_many
+from .utils import dumps_json, ensure_dir, get_logger, parse_week_id
 
 logger = get_logger()
 
+# HF paper URLs are like: /papers/2601.03252
+_PAPER_HREF_RE = re.compile(r"^/papers/(\d{4}\.\d{4,5})$")
+_ABSTRACT_RE = re.compile(r"Abstract", re.I)
+# Date in a /papers/date/ URL, e.g. /papers/date/2026-01-08
+_DATE_PAGE_RE = re.compile(r"/papers/date/(\d{4}-\d{2}-\d{2})")
 
-def get_dates_for_week(week_id: str) -> list[str]:
+# Shared session so HF requests reuse pooled keep-alive connections; also
+# retries transient failures with backoff
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+
+# Explicit encoding, as HF serves UTF-8 and raw bytes skip the decode step
+_HTML_PARSER = html.HTMLParser(encoding="utf-8")
+
+# In-process layer over the on-disk paper details cache
+_details_cache: dict[str, dict] = {}
+
+
+@lru_cache(maxsize=128)
+def get_dates_for_week(week_id: str) -> tuple[str, ...]:
     """
     Get all dates (YYYY-MM-DD) for a given week.
     
@@ -34,7 +70,7 @@ def get_dates_for_week(week_id: str) -> list[str]:
         week_id: Week identifier (e.g., "2026-01")
         
     Returns:
-        List of date strings for that week (Monday to Sunday)
+        Tuple of date strings for that week (Monday to Sunday)
     """
     year, week = parse_week_id(week_id)
     
@@ -45,14 +81,10 @@ def get_dates_for_week(week_id: str) -> list[str]:
     monday = start_of_week1 + timedelta(weeks=week - 1)
     
     # Generate all 7 days of the week
-    dates = []
-    for i in range(7):
-        day = monday + timedelta(days=i)
-        dates.append(day.strftime("%Y-%m-%d"))
-    
-    return dates
+    return tuple((monday + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(7))
 
 
+@lru_cache(maxsize=128)
 def week_id_to_iso_week(week_id: str) -> str:
     """
     Convert week_id format (e.g., "2026-01") to ISO week format (e.g., "2026-W01").
@@ -67,75 +99,166 @@ def week_id_to_iso_week(week_id: str) -> str:
     return f"{year}-W{week:02d}"
 
 
-def fetch_papers_for_week_url(week_id: str, max_papers: Optional[int] = None) -> list[dict]:
+def _parse_html(content: bytes) -> html.HtmlElement:
     """
-    Fetch papers from HF using the week URL format.
+    Parse an HTML page into an lxml document tree.
     
-    Uses https://huggingface.co/papers/week/YYYY-WXX
+    Args:
+        content: Raw response body
+        
+    Returns:
+        Root ``<html>`` element (empty document if the body is empty)
+    """
+    try:
+        return html.document_fromstring(content, parser=_HTML_PARSER)
+    except etree.ParserError:
+        return html.document_fromstring("<html></html>")
+
+
+def _text(element: html.HtmlElement) -> str:
+    """Get an element's text with each fragment stripped, like bs4's get_text(strip=True)."""
+    return "".join(fragment.strip() for fragment in element.itertext())
+
+
+def _paper_entry(paper_id: str, title: Optional[str]) -> dict:
+    """Build the paper dict returned by the scrapers."""
+    return {
+        "paper_id": paper_id,
+        "title": title or f"Paper {paper_id}",
+        "hf_url": f"{HF_PAPERS_URL}/{paper_id}",
+        "pdf_url": ARXIV_PDF_URL.format(paper_id=paper_id),
+    }
+
+
+def _extract_papers(tree: html.HtmlElement, max_papers: Optional[int] = None) -> list[dict]:
+    """
+    Extract paper entries from a parsed HF papers listing page.
+    
+    Listing pages render each paper as an ``<article>`` card, so the cards
+    are walked once and each yields its paper link and heading directly.
+    Pages without cards fall back to scanning every paper link.
     
     Args:
-        week_id: Week identifier (e.g., "2026-01")
-        max_papers: Maximum papers to fetch (None for all)
+        tree: Parsed listing page
+        max_papers: Maximum papers to return (None for all)
         
     Returns:
         List of paper dicts with keys: paper_id, title, hf_url, pdf_url
     """
-    iso_week = week_id_to_iso_week(week_id)
-    url = HF_PAPERS_WEEK_URL.format(week=iso_week)
-    logger.info(f"Fetching papers from week URL: {url}")
+    articles = tree.xpath("//article")
+    if not articles:
+        return _extract_papers_from_links(tree, max_papers)
     
-    headers = {"User-Agent": USER_AGENT}
+    papers = []
+    seen_ids: set[str] = set()
     
-    try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-    except requests.RequestException as e:
-        logger.error(f"Failed to fetch papers for week {iso_week}: {e}")
-        return []
+    for article in articles:
+        # First link in the card with a valid arXiv ID
+        for link in article.xpath('.//a[starts-with(@href, "/papers/")]'):
+            match = _PAPER_HREF_RE.match(link.get("href", ""))
+            if match:
+                break
+        else:
+            continue
+        
+        paper_id = match.group(1)
+        
+        # Avoid duplicates
+        if paper_id in seen_ids:
+            continue
+        seen_ids.add(paper_id)
+        
+        # Prefer the link text, else the card's heading
+        title = _text(link)
+        if not title or len(title) < 5:
+            heading = article.xpath("(.//h3 | .//h2 | .//h1)[1]")
+            if heading:
+                title = _text(heading[0])
+        
+        papers.append(_paper_entry(paper_id, title))
+        
+        if max_papers and len(papers) >= max_papers:
+            break
     
-    soup = BeautifulSoup(response.text, "lxml")
-    papers = []
+    return papers
+
+
+def _extract_papers_from_links(tree: html.HtmlElement, max_papers: Optional[int] = None) -> list[dict]:
+    """
+    Extract paper entries by scanning every paper link on the page.
+    
+    Fallback for layouts without ``<article>`` cards; titles missing from
+    the link text are looked up in the nearest enclosing container.
     
-    # Find paper links - they're in article elements or links matching the pattern
-    # HF paper URLs are like: /papers/2601.03252
-    paper_pattern = re.compile(r"^/papers/(\d{4}\.\d{4,5})$")
+    Args:
+        tree: Parsed listing page
+        max_papers: Maximum papers to return (None for all)
+        
+    Returns:
+        List of paper dicts with keys: paper_id, title, hf_url, pdf_url
+    """
+    papers = []
+    seen_ids: set[str] = set()
     
-    # Look for article elements with paper links
-    for link in soup.find_all("a", href=paper_pattern):
-        href = link.get("href", "")
-        match = paper_pattern.match(href)
+    # Shortlist paper links with an XPath prefix test (evaluated by libxml2),
+    # then validate the arXiv ID with the regex on the few remaining hrefs
+    for link in tree.xpath('//a[starts-with(@href, "/papers/")]'):
+        match = _PAPER_HREF_RE.match(link.get("href", ""))
         if not match:
             continue
             
         paper_id = match.group(1)
         
         # Avoid duplicates
-        if any(p["paper_id"] == paper_id for p in papers):
+        if paper_id in seen_ids:
             continue
+        seen_ids.add(paper_id)
         
         # Try to get the title from the link text or parent
-        title = link.get_text(strip=True)
+        title = _text(link)
         if not title or len(title) < 5:
             # Try to find title in parent elements
-            parent = link.find_parent(["article", "div"])
-            if parent:
-                h3 = parent.find(["h3", "h2", "h1"])
+            parent = next(link.iterancestors("article", "div"), None)
+            if parent is not None:
+                h3 = parent.xpath("(.//h3 | .//h2 | .//h1)[1]")
                 if h3:
-                    title = h3.get_text(strip=True)
-        
-        hf_url = f"{HF_PAPERS_URL}/{paper_id}"
-        pdf_url = ARXIV_PDF_URL.format(paper_id=paper_id)
+                    title = _text(h3[0])
         
-        papers.append({
-            "paper_id": paper_id,
-            "title": title or f"Paper {paper_id}",
-            "hf_url": hf_url,
-            "pdf_url": pdf_url,
-        })
+        papers.append(_paper_entry(paper_id, title))
         
         if max_papers and len(papers) >= max_papers:
             break
     
+    return papers
+
+
+def fetch_papers_for_week_url(week_id: str, max_papers: Optional[int] = None) -> list[dict]:
+    """
+    Fetch papers from HF using the week URL format.
+    
+    Uses https://huggingface.co/papers/week/YYYY-WXX
+    
+    Args:
+        week_id: Week identifier (e.g., "2026-01")
+        max_papers: Maximum papers to fetch (None for all)
+        
+    Returns:
+        List of paper dicts with keys: paper_id, title, hf_url, pdf_url
+    """
+    iso_week = week_id_to_iso_week(week_id)
+    url = HF_PAPERS_WEEK_URL.format(week=iso_week)
+    logger.info(f"Fetching papers from week URL: {url}")
+    
+    try:
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        logger.error(f"Failed to fetch papers for week {iso_week}: {e}")
+        return []
+    
+    tree = _parse_html(response.content)
+    papers = _extract_papers(tree, max_papers=max_papers)
+    
     logger.info(f"Found {len(papers)} papers for week {iso_week}")
     return papers
 
@@ -154,57 +277,15 @@ def fetch_papers_for_date(date: str, max_papers: Optional[int] = None) -> list[d
     url = HF_PAPERS_DATE_URL.format(date=date)
     logger.debug(f"Fetching papers from: {url}")
     
-    headers = {"User-Agent": USER_AGENT}
-    
     try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
     except requests.RequestException as e:
         logger.error(f"Failed to fetch papers for {date}: {e}")
         return []
     
-    soup = BeautifulSoup(response.text, "lxml")
-    papers = []
-    
-    # Find paper links - they're in article elements or links matching the pattern
-    # HF paper URLs are like: /papers/2601.03252
-    paper_pattern = re.compile(r"^/papers/(\d{4}\.\d{4,5})$")
-    
-    # Look for article elements with paper links
-    for link in soup.find_all("a", href=paper_pattern):
-        href = link.get("href", "")
-        match = paper_pattern.match(href)
-        if not match:
-            continue
-            
-        paper_id = match.group(1)
-        
-        # Avoid duplicates
-        if any(p["paper_id"] == paper_id for p in papers):
-            continue
-        
-        # Try to get the title from the link text or parent
-        title = link.get_text(strip=True)
-        if not title or len(title) < 5:
-            # Try to find title in parent elements
-            parent = link.find_parent(["article", "div"])
-            if parent:
-                h3 = parent.find(["h3", "h2", "h1"])
-                if h3:
-                    title = h3.get_text(strip=True)
-        
-        hf_url = f"{HF_PAPERS_URL}/{paper_id}"
-        pdf_url = ARXIV_PDF_URL.format(paper_id=paper_id)
-        
-        papers.append({
-            "paper_id": paper_id,
-            "title": title or f"Paper {paper_id}",
-            "hf_url": hf_url,
-            "pdf_url": pdf_url,
-        })
-        
-        if max_papers and len(papers) >= max_papers:
-            break
+    tree = _parse_html(response.content)
+    papers = _extract_papers(tree, max_papers=max_papers)
     
     logger.info(f"Found {len(papers)} papers for date {date}")
     return papers
@@ -234,10 +315,8 @@ def fetch_papers_for_date_page(date: str, max_papers: Optional[int] = None) -> t
     url = HF_PAPERS_DATE_PAGE_URL.format(date=date)
     logger.info(f"Fetching papers from date page: {url}")
     
-    headers = {"User-Agent": USER_AGENT}
-    
     try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT, allow_redirects=True)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT, allow_redirects=True)
         response.raise_for_status()
     except requests.RequestException as e:
         logger.error(f"Failed to fetch papers for {date}: {e}")
@@ -248,7 +327,7 @@ def fetch_papers_for_date_page(date: str, max_papers: Optional[int] = None) -> t
     actual_date = date
     
     # Extract date from response URL, format: /papers/date/YYYY-MM-DD
-    date_match = re.search(r"/papers/date/(\d{4}-\d{2}-\d{2})", final_url)
+    date_match = _DATE_PAGE_RE.search(final_url)
     if date_match:
         actual_date = date_match.group(1)
     
@@ -259,48 +338,75 @@ def fetch_papers_for_date_page(date: str, max_papers: Optional[int] = None) -> t
             f"HuggingFace redirected to {actual_date}."
         )
     
-    soup = BeautifulSoup(response.text, "lxml")
-    papers = []
+    tree = _parse_html(response.content)
+    papers = _extract_papers(tree, max_papers=max_papers)
     
-    # Find paper links - they're in article elements or links matching the pattern
-    paper_pattern = re.compile(r"^/papers/(\d{4}\.\d{4,5})$")
+    logger.info(f"Found {len(papers)} papers for date {actual_date}")
+    return papers, actual_date
+
+
+def _store_papers(
+    papers: Iterable[dict],
+    period_id: str,
+    max_papers: Optional[int] = None
+) -> list[dict]:
+    """
+    Record fetched papers in the database under a period (week or date) ID.
     
-    for link in soup.find_all("a", href=paper_pattern):
-        href = link.get("href", "")
-        match = paper_pattern.match(href)
-        if not match:
-            continue
-            
-        paper_id = match.group(1)
+    New papers are inserted; papers already stored (under this or another
+    period) are left as they are. Existence is checked with one query and
+    all inserts go through a single transaction.
+    
+    Args:
+        papers: Paper dicts as returned by the fetch_papers_* functions
+        period_id: Week or date identifier stored in the week_id field
+        max_papers: Maximum papers to keep (None for all)
         
-        # Avoid duplicates
-        if any(p["paper_id"] == paper_id for p in papers):
+    Returns:
+        List of paper dicts that were kept, duplicates removed
+    """
+    candidates = []
+    seen_ids = set()
+    for paper in papers:
+        if paper["paper_id"] in seen_ids:
             continue
+        seen_ids.add(paper["paper_id"])
+        candidates.append(paper)
+    
+    # Check which papers already exist in DB, in one query
+    existing = get_paper_week_ids(p["paper_id"] for p in candidates)
+    
+    stored = []
+    pending = []  # New DB rows, written in one transaction at the end
+    
+    for paper in candidates:
+        if max_papers and len(stored) >= max_papers:
+            break
         
-        # Try to get the title from the link text or parent
-        title = link.get_text(strip=True)
-        if not title or len(title) < 5:
-            parent = link.find_parent(["article", "div"])
-            if parent:
-                h3 = parent.find(["h3", "h2", "h1"])
-                if h3:
-                    title = h3.get_text(strip=True)
-        
-        hf_url = f"{HF_PAPERS_URL}/{paper_id}"
-        pdf_url = ARXIV_PDF_URL.format(paper_id=paper_id)
+        paper_id = paper["paper_id"]
+        existing_period = existing.get(paper_id)
         
-        papers.append({
-            "paper_id": paper_id,
-            "title": title or f"Paper {paper_id}",
-            "hf_url": hf_url,
-            "pdf_url": pdf_url,
-        })
+        if existing_period is not None:
+            # Paper exists - it keeps the period it was first stored under
+            if existing_period != period_id:
+                logger.info(f"Paper {paper_id} exists with week_id {existing_period}, keeping it there")
+            else:
+                logger.debug(f"Paper {paper_id} already in database for {period_id}")
+        else:
+            # Insert new paper
+            pending.append({
+                "paper_id": paper_id,
+                "week_id": period_id,
+                "title": paper["title"],
+                "hf_url": paper["hf_url"],
+                "pdf_url": paper["pdf_url"],
+            })
+            logger.info(f"Added paper: {paper_id} - {paper['title'][:50]}...")
         
-        if max_papers and len(papers) >= max_papers:
-            break
+        stored.append(paper)
     
-    logger.info(f"Found {len(papers)} papers for date {actual_date}")
-    return papers, actual_date
+    upsert_papers_many(pending)
+    return stored
 
 
 def fetch_daily_papers(
@@ -327,45 +433,8 @@ def fetch_daily_papers(
     # Fetch papers from date page (this will raise ValueError if redirected)
     papers_from_date, actual_date = fetch_papers_for_date_page(date_id, max_papers=max_papers)
     
-    all_papers = []
-    seen_ids = set()
-    
-    for paper in papers_from_date:
-        paper_id = paper["paper_id"]
-        
-        if paper_id in seen_ids:
-            continue
-        seen_ids.add(paper_id)
-        
-        # Check if paper already exists in DB
-        existing = get_paper(paper_id)
-        if existing:
-            # Paper exists - check if it's for a different date/week
-            if existing.week_id != date_id:
-                logger.info(f"Paper {paper_id} exists with week_id {existing.week_id}, updating to {date_id}")
-                # Update the week_id to match current date so download can find it
-                upsert_paper(
-                    paper_id=paper_id,
-                    week_id=date_id,
-                )
-            else:
-                logger.debug(f"Paper {paper_id} already in database for this date")
-            all_papers.append(paper)
-            continue
-        
-        # Insert new paper with date_id as the week_id
-        upsert_paper(
-            paper_id=paper_id,
-            week_id=date_id,  # Using date_id in the week_id field
-            title=paper["title"],
-            hf_url=paper["hf_url"],
-            pdf_url=paper["pdf_url"],
-        )
-        logger.info(f"Added paper: {paper_id} - {paper['title'][:50]}...")
-        all_papers.append(paper)
-        
-        if max_papers and len(all_papers) >= max_papers:
-            break
+    # Store papers with date_id as the week_id
+    all_papers = _store_papers(papers_from_date, date_id, max_papers=max_papers)
     
     logger.info(f"Total papers fetched for date {date_id}: {len(all_papers)}")
     return all_papers
@@ -390,138 +459,120 @@ def fetch_weekly_papers(
     """
     logger.info(f"Fetching papers for week {week_id}")
     
-    all_papers = []
-    seen_ids = set()
-    
     # First, try the week URL format (more efficient)
     papers_from_week = fetch_papers_for_week_url(week_id, max_papers=max_papers)
     
     if papers_from_week:
-        # Process papers from week URL
-        for paper in papers_from_week:
-            paper_id = paper["paper_id"]
-            
-            if paper_id in seen_ids:
-                continue
-            seen_ids.add(paper_id)
-            
-            # Check if paper already exists in DB
-            existing = get_paper(paper_id)
-            if existing:
-                # Paper exists - check if it's for a different week
-                if existing.week_id != week_id:
-                    logger.info(f"Paper {paper_id} exists with week_id {existing.week_id}, updating to {week_id}")
-                    upsert_paper(
-                        paper_id=paper_id,
-                        week_id=week_id,
-                    )
-                else:
-                    logger.debug(f"Paper {paper_id} already in database for this week")
-                all_papers.append(paper)
-                continue
-            
-            # Insert new paper
-            upsert_paper(
-                paper_id=paper_id,
-                week_id=week_id,
-                title=paper["title"],
-                hf_url=paper["hf_url"],
-                pdf_url=paper["pdf_url"],
-            )
-            logger.info(f"Added paper: {paper_id} - {paper['title'][:50]}...")
-            all_papers.append(paper)
-            
-            if max_papers and len(all_papers) >= max_papers:
-                break
+        all_papers = _store_papers(papers_from_week, week_id, max_papers=max_papers)
     else:
         # Fallback: fetch by date if week URL returned no results
         logger.info("Week URL returned no results, falling back to date-by-date fetching")
         dates = get_dates_for_week(week_id)
         
-        for date in dates:
-            # Check if we've hit the limit
-            remaining = None
-            if max_papers:
-                remaining = max_papers - len(all_papers)
-                if remaining <= 0:
-                    break
-            
-            papers = fetch_papers_for_date(date, max_papers=remaining)
-            
-            for paper in papers:
-                paper_id = paper["paper_id"]
-                
-                # Skip if we've already seen this paper
-                if paper_id in seen_ids:
-                    continue
-                seen_ids.add(paper_id)
-                
-                # Check if paper already exists in DB
-                existing = get_paper(paper_id)
-                if existing:
-                    # Paper exists - check if it's for a different week
-                    if existing.week_id != week_id:
-                        logger.info(f"Paper {paper_id} exists with week_id {existing.week_id}, updating to {week_id}")
-                        upsert_paper(
-                            paper_id=paper_id,
-                            week_id=week_id,
-                        )
-                    else:
-                        logger.debug(f"Paper {paper_id} already in database for this week")
-                    all_papers.append(paper)
-                    continue
-                
-                # Insert new paper
-                upsert_paper(
-                    paper_id=paper_id,
-                    week_id=week_id,
-                    title=paper["title"],
-                    hf_url=paper["hf_url"],
-                    pdf_url=paper["pdf_url"],
-                )
-                logger.info(f"Added paper: {paper_id} - {paper['title'][:50]}...")
-                all_papers.append(paper)
-                
-                if max_papers and len(all_papers) >= max_papers:
-                    break
+        # Date pages are independent, so fetch them concurrently; results keep
+        # date order and are trimmed to max_papers when storing
+        with ThreadPoolExecutor(max_workers=len(dates)) as executor:
+            papers_by_date = list(executor.map(fetch_papers_for_date, dates))
+        
+        all_papers = _store_papers(
+            (paper for papers in papers_by_date for paper in papers),
+            week_id,
+            max_papers=max_papers,
+        )
     
     logger.info(f"Total papers fetched for week {week_id}: {len(all_papers)}")
     return all_papers
 
 
+def _details_cache_path(paper_id: str) -> Path:
+    """Get the on-disk cache file for a paper's details."""
+    return CACHE_DIR / "details" / f"{paper_id}.json"
+
+
+def _read_cached_details(paper_id: str) -> Optional[dict]:
+    """
+    Read a paper's details from the disk cache.
+    
+    Returns:
+        Cached details dict, or None if missing, expired or unreadable
+    """
+    path = _details_cache_path(paper_id)
+    try:
+        if time.time() - path.stat().st_mtime > PAPER_DETAILS_CACHE_TTL_SECONDS:
+            return None
+        return json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cached_details(details: dict) -> None:
+    """Write a paper's details to the disk cache (best effort)."""
+    path = _details_cache_path(details["paper_id"])
+    try:
+        ensure_dir(path.parent)
+        path.write_bytes(dumps_json(details))
+    except OSError as e:
+        logger.debug(f"Could not cache paper details for {details['paper_id']}: {e}")
+
+
 def get_paper_details(paper_id: str) -> Optional[dict]:
     """
     Fetch detailed information about a specific paper from HF.
     
+    Results are cached in process and on disk (refreshed after
+    PAPER_DETAILS_CACHE_TTL_SECONDS); failed lookups are not cached.
+    
     Args:
         paper_id: The arXiv paper ID
         
     Returns:
         Paper details dict or None if not found
     """
-    url = f"{HF_PAPERS_URL}/{paper_id}"
-    headers = {"User-Agent": USER_AGENT}
+    details = _details_cache.get(paper_id) or _read_cached_details(paper_id)
+    if details is None:
+        details = _fetch_paper_details(paper_id)
+        if details is None:
+            return None
+        _write_cached_details(details)
+    
+    _details_cache[paper_id] = details
+    return dict(details)
+
+
+def _fetch_paper_details(paper_id: str) -> Optional[dict]:
+    """
+    Scrape a paper's HF page for its title and abstract.
     
+    Args:
+        paper_id: The arXiv paper ID
+        
+    Returns:
+        Paper details dict or None if the request failed
+    """
+    url = f"{HF_PAPERS_URL}/{paper_id}"
     try:
-        response = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        response = _SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
     except requests.RequestException as e:
         logger.error(f"Failed to fetch paper details for {paper_id}: {e}")
         return None
     
-    soup = BeautifulSoup(response.text, "lxml")
+    tree = _parse_html(response.content)
     
     # Extract title from h1
-    title_elem = soup.find("h1")
-    title = title_elem.get_text(strip=True) if title_elem else f"Paper {paper_id}"
+    title_elem = tree.find(".//h1")
+    title = _text(title_elem) if title_elem is not None else f"Paper {paper_id}"
     
     # Extract abstract
     abstract = ""
-    abstract_section = soup.find("h2", string=re.compile(r"Abstract", re.I))
-    if abstract_section:
-        next_elem = abstract_section.find_next_sibling()
+    abstract_section = next(
+        (h2 for h2 in tree.iter("h2") if _ABSTRACT_RE.search(h2.text_content())),
+        None,
+    )
+    if abstract_section is not None:
+        next_elem = abstract_section.xpath("following-sibling::*[1]")
         if next_elem:
-            abstract = next_elem.get_text(strip=True)
+            abstract = _text(next_elem[0])
     
     return {
         "paper_id": paper_id,
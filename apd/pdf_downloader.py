@@ -134,10 +134,10 @@ def download_pdfs_for_week(
     """
     from .db import list_papers
     
-    papers = list_papers(week_id=week_id)
-    
-    if max_papers:
-        papers = papers[:max_papers]
+    # Let SQLite apply the limit rather than slicing a full list; a list (not
+    # iter_papers) because download_pdf updates these same rows inside the
+    # loop, and they must not shift underneath it
+    papers = list_papers(week_id=week_id, limit=max_papers)
     
     success = 0
     failure = 0
@@ -4,18 +4,21 @@ Publisher module for Auto Paper Digest.
 Handles uploading videos to Hugging Face Datasets and generating metadata.
 """
 
+import io
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
 from dotenv import load_dotenv
-from huggingface_hub import HfApi, hf_hub_download, upload_file
+from huggingface_hub import CommitOperationAdd, HfApi, hf_hub_download
 
-from .config import DIGEST_DIR, SLIDES_DIR, VIDEO_DIR, Status
-from .db import list_papers
-from .utils import get_logger
+from .config import DIGEST_DIR, SLIDES_DIR, UPLOAD_MAX_WORKERS, VIDEO_DIR, Status
+from .db import Paper, iter_papers
+from .utils import dumps_json, get_logger
 
 # Load environment variables
 load_dotenv()
@@ -27,7 +30,34 @@ HF_TOKEN = os.getenv("HF_TOKEN")
 HF_USERNAME = os.getenv("HF_USERNAME", "")
 HF_DATASET_NAME = os.getenv("HF_DATASET_NAME", "paper-digest-videos")
 
+# Shared client; the token never changes for the life of the process
+_HF_API = HfApi(token=HF_TOKEN) if HF_TOKEN else None
 
+# Dataset repos already created/confirmed in this process
+_REPO_ENSURED: set[str] = set()
+
+# Per-paper block of the published digest, filled from a metadata entry
+_PUBLISHED_PAPER_TEMPLATE = """
+## {i}. {title}
+
+**Paper ID:** `{paper_id}`
+
+📄 [arXiv PDF]({pdf_url}) | 🤗 [HuggingFace Paper]({hf_url})
+
+### 🎬 Video Overview
+
+[![Video]({video_url})]({video_url})
+
+[▶️ Watch Video]({video_url})
+
+---
+"""
+
+# Metadata this process last uploaded, per dataset; it is the remote copy
+_SAVED_METADATA: dict[str, dict] = {}
+
+
+@lru_cache(maxsize=1)
 def get_hf_dataset_id() -> str:
     """Get the full HuggingFace dataset ID."""
     if not HF_USERNAME:
@@ -52,6 +82,23 @@ def get_video_url(dataset_id: str, video_path: str) -> str:
     return f"https://huggingface.co/datasets/{dataset_id}/resolve/main/{video_path}"
 
 
+def _ensure_repo(dataset_id: str) -> None:
+    """Create the dataset repo if needed; checked once per process."""
+    if dataset_id in _REPO_ENSURED:
+        return
+    
+    try:
+        _HF_API.create_repo(
+            repo_id=dataset_id,
+            repo_type="dataset",
+            exist_ok=True,
+            private=False,
+        )
+        _REPO_ENSURED.add(dataset_id)
+    except Exception as e:
+        logger.debug(f"Dataset creation check: {e}")
+
+
 def upload_video_to_hf(
     local_path: Path,
     remote_path: str,
@@ -75,26 +122,15 @@ def upload_video_to_hf(
     
     logger.info(f"Uploading {local_path.name} to {dataset_id}/{remote_path}")
     
-    api = HfApi(token=HF_TOKEN)
-    
     # Ensure the dataset exists (create if not)
-    try:
-        api.create_repo(
-            repo_id=dataset_id,
-            repo_type="dataset",
-            exist_ok=True,
-            private=False,
-        )
-    except Exception as e:
-        logger.debug(f"Dataset creation check: {e}")
+    _ensure_repo(dataset_id)
     
     # Upload the file
-    upload_file(
+    _HF_API.upload_file(
         path_or_fileobj=str(local_path),
         path_in_repo=remote_path,
         repo_id=dataset_id,
         repo_type="dataset",
-        token=HF_TOKEN,
     )
     
     video_url = get_video_url(dataset_id, remote_path)
@@ -107,11 +143,17 @@ def load_metadata(dataset_id: Optional[str] = None) -> dict:
     """
     Load existing metadata from HuggingFace Dataset.
     
+    If this process has already saved metadata for the dataset, that copy
+    is returned instead of downloading it again.
+    
     Returns:
         Metadata dict with structure: {"weeks": {"2026-01": [...]}}
     """
     dataset_id = dataset_id or get_hf_dataset_id()
     
+    if dataset_id in _SAVED_METADATA:
+        return _SAVED_METADATA[dataset_id]
+    
     try:
         local_path = hf_hub_download(
             repo_id=dataset_id,
@@ -142,27 +184,65 @@ def save_metadata(metadata: dict, dataset_id: Optional[str] = None) -> None:
     # Update timestamp
     metadata["last_updated"] = datetime.now().isoformat()
     
-    # Save to temp file then upload
-    temp_path = DIGEST_DIR / "metadata_temp.json"
-    temp_path.parent.mkdir(parents=True, exist_ok=True)
-    
-    with open(temp_path, "w", encoding="utf-8") as f:
-        json.dump(metadata, f, ensure_ascii=False, indent=2)
-    
-    upload_file(
-        path_or_fileobj=str(temp_path),
+    # Upload straight from memory; no temp file needed
+    _HF_API.upload_file(
+        path_or_fileobj=io.BytesIO(dumps_json(metadata)),
         path_in_repo="metadata.json",
         repo_id=dataset_id,
         repo_type="dataset",
-        token=HF_TOKEN,
     )
-    
-    # Clean up temp file
-    temp_path.unlink(missing_ok=True)
+    _SAVED_METADATA[dataset_id] = metadata
     
     logger.info(f"Metadata updated on {dataset_id}")
 
 
+def _paper_operations(
+    paper: Paper,
+    video_path: Path,
+    week_id: str,
+    dataset_id: str,
+) -> tuple[list[CommitOperationAdd], dict]:
+    """
+    Build the commit operations and metadata entry for a paper.
+    
+    Args:
+        paper: Paper record with a video
+        video_path: Local path to the video file
+        week_id: Week identifier, used as the remote directory
+        dataset_id: HF dataset ID
+        
+    Returns:
+        Tuple of (operations adding the video and slides, metadata dict)
+    """
+    remote_path = f"{week_id}/{video_path.name}"
+    operations = [CommitOperationAdd(path_in_repo=remote_path, path_or_fileobj=str(video_path))]
+    
+    # Add slides if available
+    slides_url = None
+    if paper.slides_path:
+        slides_path = Path(paper.slides_path)
+        if slides_path.exists():
+            remote_slides_path = f"{week_id}/{slides_path.name}"
+            operations.append(
+                CommitOperationAdd(path_in_repo=remote_slides_path, path_or_fileobj=str(slides_path))
+            )
+            slides_url = get_video_url(dataset_id, remote_slides_path)
+        else:
+            logger.debug(f"Slides file not found: {slides_path}")
+    
+    return operations, {
+        "paper_id": paper.paper_id,
+        "title": paper.title or f"Paper {paper.paper_id}",
+        "pdf_url": f"https://arxiv.org/pdf/{paper.paper_id}.pdf",
+        "hf_url": f"https://huggingface.co/papers/{paper.paper_id}",
+        "video_url": get_video_url(dataset_id, remote_path),
+        "video_filename": video_path.name,
+        "slides_url": slides_url,
+        "summary": paper.summary,  # NotebookLM auto-generated summary
+        "published_at": datetime.now().isoformat(),
+    }
+
+
 def publish_week(
     week_id: str,
     force: bool = False,
@@ -170,6 +250,9 @@ def publish_week(
     """
     Publish videos for a week to HuggingFace Dataset.
     
+    Videos, slides and the updated metadata.json are pushed as a single
+    commit, so a week is either fully published or left untouched.
+    
     Args:
         week_id: Week identifier (e.g., "2026-01")
         force: Force re-upload even if already published
@@ -179,10 +262,12 @@ def publish_week(
     """
     logger.info(f"Publishing videos for week {week_id}")
     
-    # Get papers with videos
-    papers = list_papers(week_id=week_id, status=Status.VIDEO_OK)
+    # Stream papers with videos; the loop below never writes to the DB, so
+    # the rows being read can't change underneath it
+    papers = iter_papers(week_id=week_id, status=Status.VIDEO_OK)
+    first_paper = next(papers, None)
     
-    if not papers:
+    if first_paper is None:
         logger.warning(f"No papers with videos found for week {week_id}")
         return 0, 0
     
@@ -190,16 +275,15 @@ def publish_week(
     
     # Load existing metadata
     metadata = load_metadata(dataset_id)
-    
-    if week_id not in metadata["weeks"]:
-        metadata["weeks"][week_id] = []
-    
-    existing_ids = {p["paper_id"] for p in metadata["weeks"][week_id]}
+    week_papers = list(metadata["weeks"].get(week_id, []))
+    existing_ids = {p["paper_id"] for p in week_papers}
     
     success = 0
     failure = 0
+    operations: list[CommitOperationAdd] = []
+    published: list[dict] = []  # Metadata entries for papers in this commit
     
-    for paper in papers:
+    for paper in chain((first_paper,), papers):
         # Skip if already published (unless force)
         if paper.paper_id in existing_ids and not force:
             logger.info(f"Paper {paper.paper_id} already published, skipping")
@@ -218,59 +302,58 @@ def publish_week(
             failure += 1
             continue
         
-        try:
-            # Upload video
-            remote_path = f"{week_id}/{video_path.name}"
-            video_url = upload_video_to_hf(video_path, remote_path, dataset_id)
-            
-            # Try to upload slides if available
-            slides_url = None
-            if paper.slides_path:
-                slides_path = Path(paper.slides_path)
-                if slides_path.exists():
-                    remote_slides_path = f"{week_id}/{slides_path.name}"
-                    try:
-                        slides_url = upload_video_to_hf(slides_path, remote_slides_path, dataset_id)
-                        logger.info(f"Uploaded slides: {slides_url}")
-                    except Exception as e:
-                        logger.warning(f"Failed to upload slides for {paper.paper_id}: {e}")
-                else:
-                    logger.debug(f"Slides file not found: {slides_path}")
-            
-            # Add to metadata
-            paper_data = {
-                "paper_id": paper.paper_id,
-                "title": paper.title or f"Paper {paper.paper_id}",
-                "pdf_url": f"https://arxiv.org/pdf/{paper.paper_id}.pdf",
-                "hf_url": f"https://huggingface.co/papers/{paper.paper_id}",
-                "video_url": video_url,
-                "video_filename": video_path.name,
-                "slides_url": slides_url,
-                "summary": paper.summary,  # NotebookLM auto-generated summary
-                "published_at": datetime.now().isoformat(),
-            }
-            
-            # Update or add paper in metadata
-            found = False
-            for i, p in enumerate(metadata["weeks"][week_id]):
-                if p["paper_id"] == paper.paper_id:
-                    metadata["weeks"][week_id][i] = paper_data
-                    found = True
-                    break
-            
-            if not found:
-                metadata["weeks"][week_id].append(paper_data)
-            
-            logger.info(f"Published: {paper.paper_id}")
-            success += 1
-            
-        except Exception as e:
-            logger.error(f"Failed to publish {paper.paper_id}: {e}")
-            failure += 1
+        paper_operations, paper_data = _paper_operations(paper, video_path, week_id, dataset_id)
+        operations.extend(paper_operations)
+        published.append(paper_data)
+    
+    # Nothing to upload if every paper was skipped or invalid
+    if not published:
+        logger.info(f"Publish complete for week {week_id}: {success} success, {failure} failed")
+        return success, failure
+    
+    if not HF_TOKEN:
+        raise ValueError("HF_TOKEN not set in .env file")
+    
+    # Update or add papers in a copy of the metadata, so a failed commit
+    # leaves the loaded metadata untouched
+    index_by_id = {p["paper_id"]: i for i, p in enumerate(week_papers)}
+    for paper_data in published:
+        i = index_by_id.get(paper_data["paper_id"])
+        if i is None:
+            index_by_id[paper_data["paper_id"]] = len(week_papers)
+            week_papers.append(paper_data)
+        else:
+            week_papers[i] = paper_data
+    
+    new_metadata = {
+        **metadata,
+        "weeks": {**metadata["weeks"], week_id: week_papers},
+        "last_updated": datetime.now().isoformat(),
+    }
+    operations.append(CommitOperationAdd(
+        path_in_repo="metadata.json",
+        path_or_fileobj=io.BytesIO(dumps_json(new_metadata)),
+    ))
     
-    # Save updated metadata
-    if success > 0:
-        save_metadata(metadata, dataset_id)
+    _ensure_repo(dataset_id)
+    logger.info(f"Uploading {len(published)} papers ({len(operations)} files) to {dataset_id}")
+    
+    try:
+        _HF_API.create_commit(
+            repo_id=dataset_id,
+            repo_type="dataset",
+            operations=operations,
+            commit_message=f"Publish {week_id}",
+            num_threads=UPLOAD_MAX_WORKERS,
+        )
+    except Exception as e:
+        logger.error(f"Failed to publish week {week_id}: {e}")
+        failure += len(published)
+    else:
+        _SAVED_METADATA[dataset_id] = new_metadata
+        for paper_data in published:
+            logger.info(f"Published: {paper_data['paper_id']}")
+        success += len(published)
     
     logger.info(f"Publish complete for week {week_id}: {success} success, {failure} failed")
     return success, failure
@@ -296,33 +379,17 @@ def generate_digest_markdown(week_id: str, dataset_id: Optional[str] = None) ->
     papers = metadata["weeks"][week_id]
     
     # Generate markdown
-    lines = [
-        f"# 📚 Paper Digest - Week {week_id}",
-        "",
-        f"> Generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-        f"> Videos hosted on [HuggingFace]({f'https://huggingface.co/datasets/{dataset_id}'})",
-        "",
-        "---",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write(f"""# 📚 Paper Digest - Week {week_id}
+
+> Generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}
+> Videos hosted on [HuggingFace](https://huggingface.co/datasets/{dataset_id})
+
+---
+""")
     
     for i, paper in enumerate(papers, 1):
-        lines.extend([
-            f"## {i}. {paper['title']}",
-            "",
-            f"**Paper ID:** `{paper['paper_id']}`",
-            "",
-            f"📄 [arXiv PDF]({paper['pdf_url']}) | 🤗 [HuggingFace Paper]({paper['hf_url']})",
-            "",
-            f"### 🎬 Video Overview",
-            "",
-            f"[![Video]({paper['video_url']})]({paper['video_url']})",
-            "",
-            f"[▶️ Watch Video]({paper['video_url']})",
-            "",
-            "---",
-            "",
-        ])
+        buf.write(_PUBLISHED_PAPER_TEMPLATE.format_map({**paper, "i": i}))
     
     # Save markdown
     output_dir = DIGEST_DIR / "published"
@@ -330,7 +397,7 @@ def generate_digest_markdown(week_id: str, dataset_id: Optional[str] = None) ->
     
     md_path = output_dir / f"{week_id}.md"
     with open(md_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        f.write(buf.getvalue())
     
     logger.info(f"Generated digest: {md_path}")
     return md_path
@@ -5,11 +5,18 @@ Provides logging setup, file hashing, and common helpers.
 """
 
 import hashlib
+import json
 import logging
 import sys
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
 
 
 def setup_logging(level: str = "INFO", log_file: Optional[Path] = None) -> logging.Logger:
@@ -94,6 +101,24 @@ def now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
 
+def dumps_json(obj: Any) -> bytes:
+    """
+    Serialize an object to pretty-printed UTF-8 JSON.
+    
+    Uses orjson when available, falling back to the stdlib encoder. Both
+    produce 2-space indented output with non-ASCII characters kept as-is.
+    
+    Args:
+        obj: JSON-serializable object
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
 def sanitize_filename(name: str, max_length: int = 100) -> str:
     """
     Sanitize a string for use as a filename.
@@ -138,6 +163,7 @@ def format_week_id(year: int, week: int) -> str:
     return f"{year}-{week:02d}"
 
 
+@lru_cache(maxsize=128)
 def parse_week_id(week_id: str) -> tuple[int, int]:
     """
     Parse week_id string into year and week.
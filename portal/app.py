@@ -3,32 +3,159 @@ Paper Digest Portal - With Embedded Video Player
 """
 
 import json
+import threading
+import time
 import gradio as gr
+import requests
 from huggingface_hub import hf_hub_download
+from requests.adapters import HTTPAdapter
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Fall back to the stdlib parser
+    _json_loads = json.loads
 
 DATASET_ID = "brianxiadong0627/paper-digest-videos"
+METADATA_URL = f"https://huggingface.co/datasets/{DATASET_ID}/resolve/main/metadata.json"
+
+# Parsed metadata.json is reused for _TTL seconds before checking the Hub again
+_TTL = 60
+_CACHE = {"data": None, "ts": 0.0, "etag": None, "weeks_sorted": ["No data"]}
+
+# Serializes fetch + cache update, so the stored ETag always belongs to the
+# stored data and an expired TTL triggers one fetch rather than one per handler
+_LOAD_LOCK = threading.Lock()
+
+# Shared session so metadata polls reuse a kept-alive TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=4))
+
+# (metadata dict, {week: [Markdown block per paper]}), rebuilt in the
+# background whenever new metadata is loaded and swapped in as one object
+_RENDERED = (None, {})
+
+# Papers shown initially, and added per "Load more" click
+PAGE_SIZE = 10
+
+# Per-paper Markdown/HTML templates used by render_paper(); preload="none"
+# keeps the browser from fetching any video data until play
+_VIDEO_TMPL = """
+<video controls preload="none" width="100%" style="max-width:640px; margin:10px 0; border-radius:8px;">
+  <source src="{url}" type="video/mp4">
+  Your browser does not support video playback. <a href="{url}">Download video</a>
+</video>
+"""
+
+_SLIDES_TMPL = """
+<p><a href="{url}" target="_blank" style="display:inline-block; padding:8px 16px; background:#10b981; color:white; border-radius:6px; text-decoration:none; margin:10px 0;">📊 Download Slides (PDF)</a></p>
+"""
+
+_SUMMARY_TMPL = """
+> 📝 **摘要**: {summary}
+
+"""
+
+_PAPER_TMPL = """
+## {i}. {title}
 
+**Paper ID:** `{pid}`
 
-def load_metadata():
+[📄 PDF]({pdf}) | [🤗 HuggingFace Paper]({hf})
+
+{summary}{video}
+{slides}
+---
+"""
+
+
+def _fetch_metadata():
+    """
+    Fetch metadata.json as (data, etag); an unchanged file (same ETag) comes
+    back as a bodiless 304 and the cached pair is returned. Call with _LOAD_LOCK held.
+    """
+    headers = {}
+    if _CACHE["etag"] and _CACHE["data"] is not None:
+        headers["If-None-Match"] = _CACHE["etag"]
+    
     try:
-        # force_download=True ensures we always get the latest metadata
-        path = hf_hub_download(
-            repo_id=DATASET_ID,
-            filename="metadata.json",
-            repo_type="dataset",
-            force_download=True  # Disable cache to get latest data
-        )
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        print(f"Error: {e}")
-        return {"weeks": {}, "last_updated": None}
+        resp = _SESSION.get(METADATA_URL, headers=headers, timeout=30)
+        if resp.status_code == 304:
+            return _CACHE["data"], _CACHE["etag"]
+        resp.raise_for_status()
+        return _json_loads(resp.content), resp.headers.get("ETag")
+    except requests.RequestException as e:
+        print(f"Metadata request failed, falling back to hub download: {e}")
+    
+    path = hf_hub_download(
+        repo_id=DATASET_ID,
+        filename="metadata.json",
+        repo_type="dataset",
+    )
+    with open(path, "rb") as f:
+        return _json_loads(f.read()), None
+
+
+def load_metadata(force=False):
+    """Load metadata.json, reusing the cached copy while it is fresh (unless force)."""
+    if not force and _CACHE["data"] is not None and time.monotonic() - _CACHE["ts"] < _TTL:
+        return _CACHE["data"]
+    
+    with _LOAD_LOCK:
+        # Another handler may have refreshed the cache while we waited
+        if not force and _CACHE["data"] is not None and time.monotonic() - _CACHE["ts"] < _TTL:
+            return _CACHE["data"]
+        
+        try:
+            data, etag = _fetch_metadata()
+        except Exception as e:
+            print(f"Error: {e}")
+            # Keep serving the last good copy; the next call retries
+            return _CACHE["data"] or {"weeks": {}, "last_updated": None}
+        
+        # A 304 hands back the cached dict itself, so there is nothing to re-render
+        changed = data is not _CACHE["data"]
+        if changed:
+            _CACHE["weeks_sorted"] = sorted(data.get("weeks", {}), reverse=True) or ["No data"]
+        _CACHE["data"] = data
+        _CACHE["etag"] = etag
+        _CACHE["ts"] = time.monotonic()
+    
+    if changed:
+        threading.Thread(target=_render_all, args=(data,), daemon=True).start()
+    return data
 
 
-def get_weeks():
+def _render_blocks(papers):
+    """Render a list of papers as numbered Markdown blocks."""
+    return [render_paper(i, p) for i, p in enumerate(papers, 1)]
+
+
+def _render_all(m):
+    """Pre-render every week so show_papers is a dict lookup."""
+    global _RENDERED
+    weeks = {week: _render_blocks(papers) for week, papers in m.get("weeks", {}).items()}
+    # Drop the result if newer metadata arrived while rendering
+    if m is _CACHE["data"]:
+        _RENDERED = (m, weeks)
+
+
+def _week_blocks(week):
+    """Get a week's rendered paper blocks for the current metadata."""
     m = load_metadata()
-    w = list(m.get("weeks", {}).keys())
-    return sorted(w, reverse=True) if w else ["No data"]
+    source, weeks = _RENDERED
+    if source is m:
+        return weeks.get(week)
+    # Background render not finished yet; render just this week
+    return _render_blocks(m.get("weeks", {}).get(week, []))
+
+
+def get_weeks(force=False):
+    # Sorted once per metadata change, in load_metadata(); a dict that is no
+    # longer (or never was) the cached one is sorted here instead
+    m = load_metadata(force=force)
+    if m is _CACHE["data"]:
+        return _CACHE["weeks_sorted"]
+    return sorted(m.get("weeks", {}), reverse=True) or ["No data"]
 
 
 def refresh_weeks():
@@ -37,67 +164,84 @@ def refresh_weeks():
     return gr.Dropdown(choices=weeks, value=weeks[0] if weeks else None)
 
 
-def show_papers(week):
+def refresh_all():
+    """Refresh button: reload metadata once, then update the week list and the shown week."""
+    weeks = get_weeks(force=True)
+    week = weeks[0]
+    return gr.Dropdown(choices=weeks, value=week), show_papers(week), 0, week
+
+
+def show_papers(week, page=0):
+    """Show the first (page + 1) * PAGE_SIZE papers of a week."""
     if not week or week == "No data":
         return "No papers available. Please select a week."
     
-    m = load_metadata()
-    papers = m.get("weeks", {}).get(week, [])
+    # Refreshes (and re-renders) the metadata if the TTL has expired
+    blocks = _week_blocks(week)
     
-    if not papers:
+    if not blocks:
         return "No papers for this week. Run `apd publish` first."
     
-    result = f"# 📚 Week {week}\n\n"
-    
-    for i, p in enumerate(papers, 1):
-        video_url = p.get('video_url', '')
-        slides_url = p.get('slides_url', '')
-        
-        # Create embedded video player HTML if video exists
-        video_html = ""
-        if video_url:
-            # Convert blob URL to resolve URL for video streaming
-            if '/blob/' in video_url:
-                video_url = video_url.replace('/blob/', '/resolve/')
-            video_html = f"""
-<video controls width="100%" style="max-width:640px; margin:10px 0; border-radius:8px;">
-  <source src="{video_url}" type="video/mp4">
-  Your browser does not support video playback. <a href="{video_url}">Download video</a>
-</video>
-"""
-        
-        # Create slides download link if available
-        slides_html = ""
-        if slides_url:
-            if '/blob/' in slides_url:
-                slides_url = slides_url.replace('/blob/', '/resolve/')
-            slides_html = f"""
-<p><a href="{slides_url}" target="_blank" style="display:inline-block; padding:8px 16px; background:#10b981; color:white; border-radius:6px; text-decoration:none; margin:10px 0;">📊 Download Slides (PDF)</a></p>
-"""
-        
-        # Get summary if available
-        summary = p.get('summary', '')
-        summary_html = ""
-        if summary:
-            # Truncate if too long for display
-            display_summary = summary[:500] + "..." if len(summary) > 500 else summary
-            summary_html = f"""
-> 📝 **摘要**: {display_summary}
+    shown = min((page + 1) * PAGE_SIZE, len(blocks))
+    parts = [f"# 📚 Week {week}\n\n", *blocks[:shown]]
+    if shown < len(blocks):
+        parts.append(f"\n*Showing 1-{shown} of {len(blocks)} papers*\n")
+    return "".join(parts)
 
-"""
-        
-        result += f"""
-## {i}. {p.get('title', 'Untitled')}
 
-**Paper ID:** `{p.get('paper_id')}`
+def load_more(week, page):
+    """Show the next page of papers; stays put once everything is shown."""
+    if (page + 1) * PAGE_SIZE < len(_week_blocks(week) or ()):
+        page += 1
+    return show_papers(week, page), page
 
-[📄 PDF]({p.get('pdf_url', '#')}) | [🤗 HuggingFace Paper]({p.get('hf_url', '#')})
 
-{summary_html}{video_html}
-{slides_html}
----
-"""
-    return result
+def show_week(week):
+    """Show a week from its first page; also records it as the shown week."""
+    return show_papers(week), 0, week
+
+
+def on_week_change(week, last_week, page):
+    """Handle a dropdown change; re-setting the shown week (e.g. on refresh) is a no-op."""
+    if week == last_week:
+        return gr.update(), page, last_week
+    return show_week(week)
+
+
+def render_paper(i, p):
+    """Render one paper as a Markdown block."""
+    video_url = p.get('video_url', '')
+    slides_url = p.get('slides_url', '')
+    
+    # Create embedded video player HTML if video exists; blob URLs are
+    # converted to resolve URLs for streaming (no-op if absent)
+    video_html = ""
+    if video_url:
+        video_html = _VIDEO_TMPL.format(url=video_url.replace('/blob/', '/resolve/'))
+    
+    # Create slides download link if available
+    slides_html = ""
+    if slides_url:
+        slides_html = _SLIDES_TMPL.format(url=slides_url.replace('/blob/', '/resolve/'))
+    
+    # Get summary if available
+    summary = p.get('summary', '')
+    summary_html = ""
+    if summary:
+        # Truncate if too long for display
+        display_summary = summary[:500] + "..." if len(summary) > 500 else summary
+        summary_html = _SUMMARY_TMPL.format(summary=display_summary)
+    
+    return _PAPER_TMPL.format(
+        i=i,
+        title=p.get('title', 'Untitled'),
+        pid=p.get('paper_id'),
+        pdf=p.get('pdf_url', '#'),
+        hf=p.get('hf_url', '#'),
+        summary=summary_html,
+        video=video_html,
+        slides=slides_html,
+    )
 
 
 # Use Blocks for more control over UI updates
@@ -106,23 +250,35 @@ with gr.Blocks(title="📚 Paper Digest Portal") as demo:
     gr.Markdown("Weekly AI/ML paper video overviews powered by NotebookLM. Videos play directly in browser!")
     
     with gr.Row():
+        weeks = get_weeks()
         week_dropdown = gr.Dropdown(
-            choices=get_weeks(), 
+            choices=weeks, 
             label="📅 Select Week", 
-            value=get_weeks()[0] if get_weeks() else None,
+            value=weeks[0] if weeks else None,
             scale=4
         )
         refresh_btn = gr.Button("🔄 Refresh Weeks", scale=1)
     
     output = gr.Markdown(label="Papers")
+    page_state = gr.State(0)
+    last_week = gr.State(None)
+    more_btn = gr.Button("⬇️ Load more")
     
-    # Event handlers
-    week_dropdown.change(fn=show_papers, inputs=week_dropdown, outputs=output)
-    refresh_btn.click(fn=refresh_weeks, outputs=week_dropdown)
+    # Event handlers; a new week starts again from the first page
+    week_dropdown.change(
+        fn=on_week_change,
+        inputs=[week_dropdown, last_week, page_state],
+        outputs=[output, page_state, last_week],
+    )
+    more_btn.click(fn=load_more, inputs=[week_dropdown, page_state], outputs=[output, page_state])
+    # Manual refresh bypasses the metadata TTL and re-renders the shown week
+    # from the same load; recording it in last_week turns the dropdown's
+    # resulting change event into a no-op
+    refresh_btn.click(fn=refresh_all, outputs=[week_dropdown, output, page_state, last_week])
     
-    # Auto-refresh week list every 5 minutes (300 seconds) to pick up new weeks
-    # Also refresh on page load
-    demo.load(fn=refresh_weeks, outputs=week_dropdown, every=300)
-    demo.load(fn=show_papers, inputs=week_dropdown, outputs=output)
+    # Refresh the week list on page load; new weeks are also picked up by the
+    # Refresh button, and the metadata TTL bounds staleness for everything else
+    demo.load(fn=refresh_weeks, outputs=week_dropdown)
+    demo.load(fn=show_week, inputs=week_dropdown, outputs=[output, page_state, last_week])
 
 demo.launch()